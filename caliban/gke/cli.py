@@ -38,9 +38,7 @@ import re
 import os
 from typing import List, Optional, Tuple, Iterable, Dict, Any
 
-import googleapiclient
 from google.auth.credentials import Credentials
-from googleapiclient import discovery
 from kubernetes.client import V1Job, V1JobSpec, V1ObjectMeta, V1Pod
 from datetime import datetime
 
@@ -176,10 +174,7 @@ def _cluster_create(args: dict, project_id: str, creds: Credentials) -> None:
   single_zone = args['single_zone']
 
   # --------------------------------------------------------------------------
-  cluster_client = googleapiclient.discovery.build('container',
-                                                   k.CLUSTER_API_VERSION,
-                                                   credentials=creds,
-                                                   cache_discovery=False)
+  cluster_client = utils.build_api('container', k.CLUSTER_API_VERSION, creds)
 
   if cluster_client is None:
     logging.error('error building cluster client')
@@ -29,7 +29,6 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import google
 import google.auth.environment_vars as auth_env
-import googleapiclient
 import kubernetes
 import requests
 # silence warnings about ssl connection not being verified
@@ -254,8 +253,7 @@ class Cluster(object):
     self._batch_api = kubernetes.client.BatchV1Api(api_client)
     self._apps_api = kubernetes.client.AppsV1Api(api_client)
 
-    self._tpu_api = googleapiclient.discovery.build(
-        'tpu', 'v1', credentials=self.credentials, cache_discovery=False)
+    self._tpu_api = utils.build_api('tpu', 'v1', self.credentials)
 
     # using this as a connection test
     # todo: is there a better way to verify connectivity?
@@ -918,8 +916,7 @@ class Cluster(object):
     list of supported gpu types on success, None otherwise
     """
 
-    container_api = googleapiclient.discovery.build(
-        'container', 'v1', credentials=self.credentials, cache_discovery=False)
+    container_api = utils.build_api('container', 'v1', self.credentials)
 
     # for some reason, autoprovisioning data is not in the _gke_cluster
     # instance, so we query using the container api here
@@ -969,10 +966,7 @@ class Cluster(object):
 
     # ------------------------------------------------------------------------
     # validate against zone instance limits
-    compute_api = googleapiclient.discovery.build('compute',
-                                                  'v1',
-                                                  credentials=self.credentials,
-                                                  cache_discovery=False)
+    compute_api = utils.build_api('compute', 'v1', self.credentials)
 
     zone_gpus = utils.get_zone_gpu_types(compute_api, self.project_id,
                                          self.zone)
@@ -1136,10 +1130,7 @@ class Cluster(object):
 
     region, _ = rz
 
-    compute_api = discovery.build('compute',
-                                  'v1',
-                                  credentials=creds,
-                                  cache_discovery=False)
+    compute_api = utils.build_api('compute', 'v1', creds)
 
     resource_limits = utils.generate_resource_limits(compute_api, project_id,
                                                      region)
@@ -17,16 +17,20 @@
 
 from __future__ import absolute_import
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 import logging
 from urllib.parse import urlencode, urlparse
-from time import sleep
+from time import sleep, time
+import random
 import re
 import os
 import pprint as pp
 import json
 import yaml
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from operator import itemgetter
 from yaspin import yaspin
 from yaspin.spinners import Spinners
 
@@ -50,6 +54,25 @@ from caliban.gke.types import (NodeImage, OpStatus, CredentialsData,
                                ReleaseChannel)
 from caliban.cloud.types import (GPU, GPUSpec, TPU, TPUSpec)
 
+_TPU_RE = re.compile(r'^(?P<tpu>(v2|v3))-(?P<count>[0-9]+)$')
+_GPU_RE = re.compile(r'^nvidia-tesla-(?P<type>[a-z0-9]+)$')
+_QUOTA_GPU_RE = re.compile(r'^NVIDIA_(?P<gpu>[A-Z0-9]+)_GPUS$')
+
+_TPU_BY_NAME = {t.name: t for t in TPU}
+_GPU_BY_NAME = {g.name: g for g in GPU}
+
+_YES = frozenset(['y', 'yes'])
+_NO = frozenset(['n', 'no'])
+
+# per-process cache of zone/region listings, keyed on
+# (listing name, project id, zone or region)
+_LISTING_CACHE: Dict[Tuple[str, str, str], Any] = {}
+
+_DAEMONSETS = {
+    NodeImage.COS: k.NVIDIA_DRIVER_COS_DAEMONSET_URL,
+    NodeImage.UBUNTU: k.NVIDIA_DRIVER_UBUNTU_DAEMONSET_URL
+}
+
 
 # ----------------------------------------------------------------------------
 def trap(error_value: Any, silent: bool = True) -> Any:
@@ -65,6 +88,7 @@ def trap(error_value: Any, silent: bool = True) -> Any:
 
   def check(fn):
 
+    @functools.wraps(fn)
     def wrapper(*args, **kwargs):
       try:
         response = fn(*args, **kwargs)
@@ -79,6 +103,49 @@ def trap(error_value: Any, silent: bool = True) -> Any:
   return check
 
 
+# ----------------------------------------------------------------------------
+def clear_listing_cache() -> None:
+  """clears cached zone and region listings"""
+  _LISTING_CACHE.clear()
+
+
+# ----------------------------------------------------------------------------
+def _cache_listing(key: Tuple[str, str, str], value: Any) -> Any:
+  """caches a listing result, ignoring errors (None)
+
+  Args:
+  key: (listing name, project id, zone or region)
+  value: listing result
+
+  Returns:
+  value
+  """
+
+  if value is not None:
+    _LISTING_CACHE[key] = value
+  return value
+
+
+# ----------------------------------------------------------------------------
+def build_api(name: str, version: str,
+              credentials: Credentials) -> discovery.Resource:
+  """builds a discovery api resource
+
+  Args:
+  name: api name
+  version: api version
+  credentials: credentials for api
+
+  Returns:
+  api resource
+  """
+
+  return discovery.build(name,
+                         version,
+                         credentials=credentials,
+                         cache_discovery=False)
+
+
 # ----------------------------------------------------------------------------
 def validate_gpu_spec_against_limits(
     gpu_spec: GPUSpec,
@@ -96,16 +163,18 @@ def validate_gpu_spec_against_limits(
   True if spec is valid, False otherwise
   """
 
-  if gpu_spec.gpu not in gpu_limits:
-    logging.error('unsupported gpu type {}. '.format(gpu_spec.gpu.name) +
-                  'Supported types for {}: {}'.format(
-                      limit_type, [g.name for g in gpu_limits]))
+  max_count = gpu_limits.get(gpu_spec.gpu)
+
+  if max_count is None:
+    if logging.getLogger().isEnabledFor(logging.ERROR):
+      logging.error('unsupported gpu type %s. Supported types for %s: %s',
+                    gpu_spec.gpu.name, limit_type,
+                    [g.name for g in gpu_limits])
     return False
 
-  if gpu_spec.count > gpu_limits[gpu_spec.gpu]:
-    logging.error('error: requested {} gpu count {} unsupported,'.format(
-        gpu_spec.gpu.name, gpu_spec.count) +
-                  ' {} max = {}'.format(limit_type, gpu_limits[gpu_spec.gpu]))
+  if gpu_spec.count > max_count:
+    logging.error('error: requested %s gpu count %s unsupported, %s max = %s',
+                  gpu_spec.gpu.name, gpu_spec.count, limit_type, max_count)
     return False
 
   return True
@@ -122,12 +191,7 @@ def nvidia_daemonset_url(node_image: NodeImage) -> Optional[str]:
   daemonset yaml url on success, None otherwise
   '''
 
-  DAEMONSETS = {
-      NodeImage.COS: k.NVIDIA_DRIVER_COS_DAEMONSET_URL,
-      NodeImage.UBUNTU: k.NVIDIA_DRIVER_UBUNTU_DAEMONSET_URL
-  }
-
-  return DAEMONSETS.get(node_image, None)
+  return _DAEMONSETS.get(node_image, None)
 
 
 # ----------------------------------------------------------------------------
@@ -147,6 +211,34 @@ def dashboard_cluster_url(cluster_id: str, zone: str, project_id: str):
   return '{}/{}/{}?{}'.format(k.DASHBOARD_CLUSTER_URL, zone, cluster_id, query)
 
 
+# ----------------------------------------------------------------------------
+def _location(project_id: str, zone: str) -> str:
+  """returns api location path for given project, zone"""
+  return f'projects/{project_id}/locations/{zone}'
+
+
+# ----------------------------------------------------------------------------
+def _tpu_drivers_request(tpu_api: discovery.Resource, project_id: str,
+                         zone: str) -> HttpRequest:
+  """creates request for supported tpu drivers in given project, zone"""
+
+  location = _location(project_id, zone)
+  return tpu_api.projects().locations().tensorflowVersions().list(
+      parent=location, fields='tensorflowVersions(version)')
+
+
+# ----------------------------------------------------------------------------
+@trap(None)
+def _tpu_drivers_from_response(rsp: Optional[dict]) -> Optional[List[str]]:
+  """extracts supported tpu drivers from tensorflowVersions response"""
+
+  if rsp is None:
+    logging.error('error getting tpu drivers')
+    return None
+
+  return [d['version'] for d in rsp['tensorflowVersions']]
+
+
 # ----------------------------------------------------------------------------
 @trap(None)
 def get_tpu_drivers(tpu_api: discovery.Resource, project_id: str,
@@ -162,16 +254,8 @@ def get_tpu_drivers(tpu_api: discovery.Resource, project_id: str,
   list of supported drivers on success, None otherwise
   """
 
-  location = 'projects/{}/locations/{}'.format(project_id, zone)
-
-  rsp = tpu_api.projects().locations().tensorflowVersions().list(
-      parent=location).execute()
-
-  if rsp is None:
-    logging.error('error getting tpu drivers')
-    return None
-
-  return [d['version'] for d in rsp['tensorflowVersions']]
+  return _tpu_drivers_from_response(
+      _tpu_drivers_request(tpu_api, project_id, zone).execute())
 
 
 # ----------------------------------------------------------------------------
@@ -187,19 +271,20 @@ def user_verify(msg: str, default: bool) -> bool:
   """
   choice_str = '[Yn]' if default else '[yN]'
 
-  while True:
-    ok = input('\n {} {}: '.format(msg, choice_str)).lower()
+  prompt = '\n {} {}: '.format(msg, choice_str)
 
-    if len(ok) == 0:
+  while True:
+    raw = input(prompt)
+    if not raw:
       return default
 
-    if ok not in ['y', 'n']:
-      print('please enter y or n')
-      continue
+    choice = raw.strip().casefold()
+    if choice in _YES:
+      return True
+    if choice in _NO:
+      return False
 
-    return (ok == 'y')
-
-  return False
+    print('please enter y or n')
 
 
 # ----------------------------------------------------------------------------
@@ -211,16 +296,25 @@ def wait_for_operation(cluster_api: discovery.Resource,
                        ],
                        sleep_sec: int = 1,
                        message: str = '',
-                       spinner: bool = True) -> Optional[dict]:
+                       spinner: bool = True,
+                       max_sleep_sec: int = 30,
+                       timeout_sec: Optional[int] = None) -> Optional[dict]:
   """waits for cluster operation to reach given state(s)
 
+  The polling interval starts at sleep_sec and doubles after each poll, up to
+  max_sleep_sec, with up to 25% random jitter added. We have to poll here, as
+  the container api operations resource only supports get/list/cancel and has
+  no server-side wait method.
+
   Args:
   cluster_api: cluster api client
   name: operation name, of form projects/*/locations/*/operations/*
   conditions: exit status conditions
-  sleep_sec: polling interval
+  sleep_sec: initial polling interval
   message: wait message
   spinner: display spinner while waiting
+  max_sleep_sec: maximum polling interval
+  timeout_sec: maximum total wait time, None = wait indefinitely
 
   Returns:
   response dictionary on success, None otherwise
@@ -232,14 +326,22 @@ def wait_for_operation(cluster_api: discovery.Resource,
   condition_strings = [x.name for x in conditions]
 
   def _wait():
+    start = time()
+    attempt = 0
     while True:
       rsp = cluster_api.projects().locations().operations().get(
-          name=name).execute()
+          name=name, fields='name,status,error,selfLink').execute()
 
       if rsp['status'] in condition_strings:
         return rsp
 
-      sleep(sleep_sec)
+      if timeout_sec is not None and time() - start > timeout_sec:
+        logging.error('timed out waiting for operation {}'.format(name))
+        return None
+
+      delay = min(max_sleep_sec, sleep_sec * (2**attempt))
+      sleep(delay + random.uniform(0, 0.25 * delay))
+      attempt += 1
     return None
 
   if spinner:
@@ -250,7 +352,6 @@ def wait_for_operation(cluster_api: discovery.Resource,
 
 
 # ----------------------------------------------------------------------------
-@trap(None)
 def gke_tpu_to_tpuspec(tpu: str) -> Optional[TPUSpec]:
   """convert gke tpu accelerator string to TPUSpec
 
@@ -261,10 +362,40 @@ def gke_tpu_to_tpuspec(tpu: str) -> Optional[TPUSpec]:
   TPUSpec on success, None otherwise
   """
 
-  tpu_re = re.compile('^(?P<tpu>(v2|v3))-(?P<count>[0-9]+)$')
-  gd = tpu_re.match(tpu).groupdict()
+  m = _TPU_RE.match(tpu)
+  if m is None:
+    return None
+
+  tpu_type = _TPU_BY_NAME.get(m.group('tpu').upper())
+  if tpu_type is None:
+    return None
+
+  return TPUSpec(tpu_type, int(m.group('count')))
+
+
+# ----------------------------------------------------------------------------
+def _zone_tpu_types_request(tpu_api: discovery.Resource, project_id: str,
+                            zone: str) -> HttpRequest:
+  """creates request for tpu accelerator types in given project, zone"""
 
-  return TPUSpec(TPU[gd['tpu'].upper()], int(gd['count']))
+  location = _location(project_id, zone)
+  return tpu_api.projects().locations().acceleratorTypes().list(
+      parent=location, fields='acceleratorTypes(type)')
+
+
+# ----------------------------------------------------------------------------
+@trap(None)
+def _zone_tpu_types_from_response(
+    rsp: Optional[dict]) -> Optional[List[TPUSpec]]:
+  """extracts supported tpu specs from acceleratorTypes response"""
+
+  if rsp is None:
+    logging.error('error getting tpu types')
+    return None
+
+  specs = map(gke_tpu_to_tpuspec, map(itemgetter('type'),
+                                      rsp['acceleratorTypes']))
+  return [s for s in specs if s is not None]
 
 
 # ----------------------------------------------------------------------------
@@ -273,6 +404,9 @@ def get_zone_tpu_types(tpu_api: discovery.Resource, project_id: str,
                        zone: str) -> Optional[List[TPUSpec]]:
   """gets list of tpus available in given zone
 
+  Successful results are cached for the life of the process, see
+  clear_listing_cache().
+
   Args:
   tpu_api: tpu api instance
   project_id: project id
@@ -282,22 +416,17 @@ def get_zone_tpu_types(tpu_api: discovery.Resource, project_id: str,
   list of supported tpu specs on success, None otherwise
   """
 
-  location = 'projects/{}/locations/{}'.format(project_id, zone)
-  rsp = tpu_api.projects().locations().acceleratorTypes().list(
-      parent=location).execute()
+  key = ('tpu_types', project_id, zone)
+  if key in _LISTING_CACHE:
+    return _LISTING_CACHE[key]
 
-  tpus = []
-  for t in rsp['acceleratorTypes']:
-    spec = gke_tpu_to_tpuspec(t['type'])
-    if spec is None:
-      continue
-    tpus.append(spec)
-
-  return tpus
+  return _cache_listing(
+      key,
+      _zone_tpu_types_from_response(
+          _zone_tpu_types_request(tpu_api, project_id, zone).execute()))
 
 
 # ----------------------------------------------------------------------------
-@trap(None)
 def gke_gpu_to_gpu(gpu: str) -> Optional[GPU]:
   """convert gke gpu string to GPU type
 
@@ -308,9 +437,39 @@ def gke_gpu_to_gpu(gpu: str) -> Optional[GPU]:
   GPU on success, None otherwise
   """
 
-  gpu_re = re.compile('^nvidia-tesla-(?P<type>[a-z0-9]+)$')
-  gd = gpu_re.match(gpu).groupdict()
-  return GPU[gd['type'].upper()]
+  m = _GPU_RE.match(gpu)
+  if m is None:
+    return None
+
+  return _GPU_BY_NAME.get(m.group('type').upper())
+
+
+# ----------------------------------------------------------------------------
+def _zone_gpu_types_request(compute_api: discovery.Resource, project_id: str,
+                            zone: str) -> HttpRequest:
+  """creates request for gpu accelerator types in given project, zone"""
+
+  return compute_api.acceleratorTypes().list(
+      project=project_id,
+      zone=zone,
+      fields='items(name,maximumCardsPerInstance)')
+
+
+# ----------------------------------------------------------------------------
+@trap(None)
+def _zone_gpu_types_from_response(
+    rsp: Optional[dict]) -> Optional[List[GPUSpec]]:
+  """extracts gpu specs from acceleratorTypes response"""
+
+  if rsp is None:
+    logging.error('error getting gpu types')
+    return None
+
+  gpus = ((gke_gpu_to_gpu(x['name']), x) for x in rsp['items'])
+  return [
+      GPUSpec(g, int(x['maximumCardsPerInstance'])) for g, x in gpus
+      if g is not None
+  ]
 
 
 # ----------------------------------------------------------------------------
@@ -319,6 +478,9 @@ def get_zone_gpu_types(compute_api: discovery.Resource, project_id: str,
                        zone: str) -> Optional[List[GPUSpec]]:
   """gets list of gpu accelerators available in given zone
 
+  Successful results are cached for the life of the process, see
+  clear_listing_cache().
+
   Args:
   compute_api: compute api instance
   project_id: project id
@@ -328,18 +490,37 @@ def get_zone_gpu_types(compute_api: discovery.Resource, project_id: str,
   list of GPUSpec on success (count is max count), None otherwise
   """
 
-  rsp = compute_api.acceleratorTypes().list(project=project_id,
-                                            zone=zone).execute()
+  key = ('gpu_types', project_id, zone)
+  if key in _LISTING_CACHE:
+    return _LISTING_CACHE[key]
 
-  gpus = []
+  return _cache_listing(
+      key,
+      _zone_gpu_types_from_response(
+          _zone_gpu_types_request(compute_api, project_id, zone).execute()))
 
-  for x in rsp['items']:
-    gpu = gke_gpu_to_gpu(x['name'])
-    if gpu is None:
-      continue
-    gpus.append(GPUSpec(gpu, int(x['maximumCardsPerInstance'])))
 
-  return gpus
+# ----------------------------------------------------------------------------
+def _region_quotas_request(compute_api: discovery.Resource, project_id: str,
+                           region: str) -> HttpRequest:
+  """creates request for compute quotas in given project, region"""
+
+  return compute_api.regions().get(project=project_id,
+                                   region=region,
+                                   fields='quotas(metric,limit,usage)')
+
+
+# ----------------------------------------------------------------------------
+@trap(None)
+def _region_quotas_from_response(
+    rsp: Optional[dict]) -> Optional[List[Dict[str, Any]]]:
+  """extracts quota dicts from regions response"""
+
+  if rsp is None:
+    logging.error('error getting region quotas')
+    return None
+
+  return rsp.get('quotas', [])
 
 
 # ----------------------------------------------------------------------------
@@ -351,6 +532,9 @@ def get_region_quotas(compute_api: discovery.Resource, project_id: str,
   These quotas include cpu and gpu quotas for the given region.
   (tpu quotas are not included here)
 
+  Successful results are cached for the life of the process, see
+  clear_listing_cache().
+
   Args:
   compute_api: compute_api instance
   project_id: project id
@@ -360,52 +544,66 @@ def get_region_quotas(compute_api: discovery.Resource, project_id: str,
   list of quota dicts, with keys {'limit', 'metric', 'usage'}, None on error
   """
 
-  return compute_api.regions().get(project=project_id,
-                                   region=region).execute().get('quotas', [])
+  key = ('quotas', project_id, region)
+  if key in _LISTING_CACHE:
+    return _LISTING_CACHE[key]
+
+  return _cache_listing(
+      key,
+      _region_quotas_from_response(
+          _region_quotas_request(compute_api, project_id, region).execute()))
 
 
 # ----------------------------------------------------------------------------
-@trap(None)
-def resource_limits_from_quotas(
-    quotas: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
-  """create resource limits from quota dictionary
+def _iter_resource_limits(
+    quotas: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+  """yields resource limits for each cpu or gpu quota
 
   Args:
-  quotas: list of quota dicts, with keys {'limit', 'metric', 'usage'}
+  quotas: quota dicts, with keys {'limit', 'metric', 'usage'}
 
   Returns:
-  resource limits dictionaries on success, None otherwise
+  iterator over resource limit dictionaries
   """
 
-  limits = []
-
-  gpu_re = re.compile('^NVIDIA_(?P<gpu>[A-Z0-9]+)_GPUS$')
-
   for q in quotas:
     metric = q['metric']
     limit = q['limit']
 
     if metric == 'CPUS':
-      limits.append({'resourceType': 'cpu', 'maximum': str(limit)})
-      limits.append({
+      yield {'resourceType': 'cpu', 'maximum': str(limit)}
+      yield {
           'resourceType': 'memory',
           'maximum': str(int(limit) * k.MAX_GB_PER_CPU)
-      })
+      }
       continue
 
-    gpu_match = gpu_re.match(metric)
+    gpu_match = _QUOTA_GPU_RE.match(metric)
     if gpu_match is None:
       continue
 
-    gd = gpu_match.groupdict()
-    gpu_type = gd['gpu']
-
-    limits.append({
-        'resourceType': 'nvidia-tesla-{}'.format(gpu_type.lower()),
+    yield {
+        'resourceType': 'nvidia-tesla-{}'.format(
+            gpu_match.group('gpu').lower()),
         'maximum': str(limit)
-    })
+    }
 
-  return limits
+
+# ----------------------------------------------------------------------------
+@trap(None)
+def resource_limits_from_quotas(
+    quotas: Iterable[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+  """create resource limits from quota dictionary
+
+  Args:
+  quotas: quota dicts, with keys {'limit', 'metric', 'usage'}
+
+  Returns:
+  resource limits dictionaries on success, None otherwise
+  """
+
+  # materialize here so that errors in the quota data are trapped
+  return list(_iter_resource_limits(quotas))
 
 
 # ----------------------------------------------------------------------------
@@ -430,6 +628,137 @@ def generate_resource_limits(compute_api: discovery.Resource, project_id: str,
   return resource_limits_from_quotas(quotas)
 
 
+# ----------------------------------------------------------------------------
+@trap(None, silent=False)
+def get_gke_inventory(project_id: str, zone: str, region: str,
+                      tpu_api: discovery.Resource,
+                      compute_api: discovery.Resource) -> Optional[dict]:
+  """gets tpu drivers, accelerator types and resource limits for a zone
+
+  The tpu and compute requests are each sent as a single batch http request,
+  so this costs two round trips instead of the four needed when calling
+  get_tpu_drivers, get_zone_tpu_types, get_zone_gpu_types and
+  generate_resource_limits individually.
+
+  Args:
+  project_id: project id
+  zone: zone string
+  region: region string (region containing zone)
+  tpu_api: tpu api instance
+  compute_api: compute api instance
+
+  Returns:
+  dictionary with keys {'tpu_drivers', 'tpu_types', 'gpu_types',
+  'resource_limits'} on success, None otherwise. The value for any key whose
+  request failed is None.
+
+  tpu types, gpu types and quotas share the listing cache used by
+  get_zone_tpu_types, get_zone_gpu_types and get_region_quotas, so cached
+  listings are not requested again.
+  """
+
+  keys = {
+      'tpu_types': ('tpu_types', project_id, zone),
+      'gpu_types': ('gpu_types', project_id, zone),
+      'quotas': ('quotas', project_id, region),
+  }
+
+  cached = {
+      request_id: _LISTING_CACHE[key]
+      for request_id, key in keys.items()
+      if key in _LISTING_CACHE
+  }
+
+  responses = {}
+
+  def _store(request_id, rsp, exception):
+    if exception is not None:
+      logging.error('error in batch request {}: {}'.format(
+          request_id, exception))
+      return
+    responses[request_id] = rsp
+
+  tpu_batch = tpu_api.new_batch_http_request(callback=_store)
+  tpu_batch.add(_tpu_drivers_request(tpu_api, project_id, zone),
+                request_id='tpu_drivers')
+  if 'tpu_types' not in cached:
+    tpu_batch.add(_zone_tpu_types_request(tpu_api, project_id, zone),
+                  request_id='tpu_types')
+  tpu_batch.execute()
+
+  compute_requests = []
+  if 'gpu_types' not in cached:
+    compute_requests.append(
+        (_zone_gpu_types_request(compute_api, project_id, zone), 'gpu_types'))
+  if 'quotas' not in cached:
+    compute_requests.append(
+        (_region_quotas_request(compute_api, project_id, region), 'quotas'))
+
+  if len(compute_requests) > 0:
+    compute_batch = compute_api.new_batch_http_request(callback=_store)
+    for request, request_id in compute_requests:
+      compute_batch.add(request, request_id=request_id)
+    compute_batch.execute()
+
+  parsers = {
+      'tpu_types': _zone_tpu_types_from_response,
+      'gpu_types': _zone_gpu_types_from_response,
+      'quotas': _region_quotas_from_response,
+  }
+
+  for request_id, parse in parsers.items():
+    if request_id not in cached:
+      cached[request_id] = _cache_listing(keys[request_id],
+                                          parse(responses.get(request_id)))
+
+  resource_limits = None
+  if cached['quotas'] is not None:
+    resource_limits = resource_limits_from_quotas(cached['quotas'])
+
+  return {
+      'tpu_drivers': _tpu_drivers_from_response(responses.get('tpu_drivers')),
+      'tpu_types': cached['tpu_types'],
+      'gpu_types': cached['gpu_types'],
+      'resource_limits': resource_limits,
+  }
+
+
+# ----------------------------------------------------------------------------
+@trap(None, silent=False)
+def get_zones_inventory(project_id: str, zones: List[str],
+                        credentials: Credentials) -> Optional[Dict[str, dict]]:
+  """gets gpu and tpu types for several zones in parallel
+
+  httplib2 connections are not thread-safe, so each worker builds its own
+  api resources rather than sharing one across threads. build_api uses
+  discovery.build without a discovery cache, which reads the discovery
+  documents bundled with googleapiclient, so this makes no extra requests.
+
+  Args:
+  project_id: project id
+  zones: list of zone strings
+  credentials: credentials for compute and tpu apis
+
+  Returns:
+  dictionary of zone -> {'gpu_types', 'tpu_types'} on success, None otherwise
+  (see get_zone_gpu_types and get_zone_tpu_types for values)
+  """
+
+  if len(zones) == 0:
+    return {}
+
+  def _zone_inventory(zone):
+    compute_api = build_api('compute', 'v1', credentials)
+    tpu_api = build_api('tpu', 'v1', credentials)
+    return {
+        'gpu_types': get_zone_gpu_types(compute_api, project_id, zone),
+        'tpu_types': get_zone_tpu_types(tpu_api, project_id, zone),
+    }
+
+  with ThreadPoolExecutor(max_workers=min(8, len(zones))) as executor:
+    return dict(zip(zones, executor.map(_zone_inventory, zones)))
+
+
 # ----------------------------------------------------------------------------
 @trap(None, silent=False)
 def job_to_dict(job: V1Job) -> Optional[dict]:
@@ -802,6 +1131,8 @@ def get_zones_in_region(compute_api: discovery.Resource, project_id: str,
   list of zone strings on success, None otherwise
   '''
 
-  rsp = compute_api.regions().get(project=project_id, region=region).execute()
+  rsp = compute_api.regions().get(project=project_id,
+                                  region=region,
+                                  fields='zones').execute()
 
   return [urlparse(x).path.split('/')[-1] for x in rsp['zones']]
@@ -164,6 +164,7 @@ class UtilsTestSuite(unittest.TestCase):
 
     self.assertEqual(return_val, _test_raises())
     self.assertEqual(valid_return, _test_no_raise())
+    self.assertEqual('_test_raises', _test_raises.__name__)
 
     return
 
@@ -190,7 +191,7 @@ class UtilsTestSuite(unittest.TestCase):
       def operations(self):
         return self
 
-      def get(self, name):
+      def get(self, name, fields=None):
         return self
 
     def _raises():
@@ -237,6 +238,56 @@ class UtilsTestSuite(unittest.TestCase):
 
     return
 
+  # --------------------------------------------------------------------------
+  @mock.patch('caliban.gke.utils.sleep')
+  def test_wait_for_operation_backoff(self, mocked_sleep):
+    """tests wait_for_operation polling interval and timeout"""
+
+    class mock_api:
+
+      def projects(self):
+        return self
+
+      def locations(self):
+        return self
+
+      def operations(self):
+        return self
+
+      def get(self, name, fields=None):
+        return self
+
+    api = mock_api()
+    statuses = [OpStatus.RUNNING.value] * 8 + [OpStatus.DONE.value]
+    rsp_generator = iter(statuses)
+    api.execute = lambda: {'status': next(rsp_generator)}
+
+    self.assertEqual({'status': OpStatus.DONE.value},
+                     utils.wait_for_operation(api,
+                                              'name',
+                                              sleep_sec=1,
+                                              max_sleep_sec=16,
+                                              spinner=False))
+
+    # interval doubles up to max, with at most 25% jitter
+    delays = [c[0][0] for c in mocked_sleep.call_args_list]
+    expected = [1, 2, 4, 8, 16, 16, 16, 16]
+    self.assertEqual(len(expected), len(delays))
+    for d, e in zip(delays, expected):
+      self.assertTrue(e <= d <= 1.25 * e)
+
+    # timeout
+    api.execute = lambda: {'status': OpStatus.RUNNING.value}
+    with mock.patch('caliban.gke.utils.time', side_effect=[0, 5, 11]):
+      self.assertIsNone(
+          utils.wait_for_operation(api,
+                                   'name',
+                                   sleep_sec=1,
+                                   spinner=False,
+                                   timeout_sec=10))
+
+    return
+
   # --------------------------------------------------------------------------
   @given(
       st.sets(
@@ -247,6 +298,8 @@ class UtilsTestSuite(unittest.TestCase):
   def test_get_zone_tpu_types(self, tpu_types, invalid_types):
     """tests get_zone_tpu_types"""
 
+    utils.clear_listing_cache()
+
     tpus = ['{}-{}'.format(x[1].name.lower(), x[0]) for x in tpu_types]
 
     invalid_types = list(invalid_types)
@@ -265,7 +318,7 @@ class UtilsTestSuite(unittest.TestCase):
       def acceleratorTypes(self):
         return self
 
-      def list(self, parent):
+      def list(self, parent, fields=None):
         return self
 
     def _raises():
@@ -298,6 +351,20 @@ class UtilsTestSuite(unittest.TestCase):
 
     return
 
+  # --------------------------------------------------------------------------
+  def test_build_api(self):
+    """tests build_api"""
+
+    with mock.patch.object(utils.discovery, 'build',
+                           return_value='api') as build:
+      self.assertEqual('api', utils.build_api('foo', 'v1', 'creds'))
+      build.assert_called_once_with('foo',
+                                    'v1',
+                                    credentials='creds',
+                                    cache_discovery=False)
+
+    return
+
   # --------------------------------------------------------------------------
   @given(st.text())
   def test_sanitize_job_name(self, job_name):
@@ -330,6 +397,8 @@ class UtilsTestSuite(unittest.TestCase):
   def test_get_zone_gpu_types(self, gpu_counts, invalid_types):
     """tests get_zone_gpu_types"""
 
+    utils.clear_listing_cache()
+
     gpu_types = ['nvidia-tesla-{}'.format(x.name.lower()) for x in ct.GPU]
 
     gpus = [{
@@ -347,7 +416,7 @@ class UtilsTestSuite(unittest.TestCase):
       def acceleratorTypes(self):
         return self
 
-      def list(self, project, zone):
+      def list(self, project, zone, fields=None):
         return self
 
     def _raises():
@@ -387,12 +456,14 @@ class UtilsTestSuite(unittest.TestCase):
   def test_get_region_quotas(self):
     """tests get region quotas"""
 
+    utils.clear_listing_cache()
+
     class mock_api:
 
       def regions(self):
         return self
 
-      def get(self, project, region):
+      def get(self, project, region, fields=None):
         return self
 
     def _raises():
@@ -424,6 +495,8 @@ class UtilsTestSuite(unittest.TestCase):
     api.execute = _invalid
     self.assertEqual([], utils.get_region_quotas(api, 'p', 'r'))
 
+    # listings are cached, so clear here to pick up the new response
+    utils.clear_listing_cache()
     # normal execution
     api.execute = _normal
     self.assertEqual(_normal()['quotas'],
@@ -431,16 +504,65 @@ class UtilsTestSuite(unittest.TestCase):
 
     return
 
+  # --------------------------------------------------------------------------
+  def test_listing_cache(self):
+    """tests caching of zone and region listings"""
+
+    utils.clear_listing_cache()
+
+    class mock_api:
+
+      def __init__(self):
+        self.calls = 0
+
+      def regions(self):
+        return self
+
+      def get(self, project, region, fields=None):
+        return self
+
+      def execute(self):
+        self.calls += 1
+        if self.calls == 1:
+          raise Exception('exception')
+        return {'quotas': [{'limit': 4, 'metric': 'CPUS', 'usage': 1}]}
+
+    api = mock_api()
+
+    # errors are not cached
+    self.assertIsNone(utils.get_region_quotas(api, 'p', 'r'))
+    quotas = utils.get_region_quotas(api, 'p', 'r')
+    self.assertIsNotNone(quotas)
+    self.assertEqual(2, api.calls)
+
+    # cached
+    self.assertEqual(quotas, utils.get_region_quotas(api, 'p', 'r'))
+    self.assertEqual(2, api.calls)
+
+    # keyed on project and region
+    utils.get_region_quotas(api, 'p', 'r2')
+    utils.get_region_quotas(api, 'p2', 'r')
+    self.assertEqual(4, api.calls)
+
+    # cleared
+    utils.clear_listing_cache()
+    self.assertEqual(quotas, utils.get_region_quotas(api, 'p', 'r'))
+    self.assertEqual(5, api.calls)
+
+    return
+
   # --------------------------------------------------------------------------
   def test_generate_resource_limits(self):
     """tests generation of resource limits"""
 
+    utils.clear_listing_cache()
+
     class mock_api:
 
       def regions(self):
         return self
 
-      def get(self, project, region):
+      def get(self, project, region, fields=None):
         return self
 
     def _raises():
@@ -472,6 +594,8 @@ class UtilsTestSuite(unittest.TestCase):
     api.execute = _invalid
     self.assertEqual([], utils.generate_resource_limits(api, 'p', 'r'))
 
+    # listings are cached, so clear here to pick up the new response
+    utils.clear_listing_cache()
     # normal execution
     api.execute = _normal
     quotas = _normal()['quotas']
@@ -490,6 +614,323 @@ class UtilsTestSuite(unittest.TestCase):
 
     return
 
+  # --------------------------------------------------------------------------
+  def test_gke_accelerator_conversion(self):
+    """tests gke tpu/gpu string conversion"""
+
+    for t in ct.TPU:
+      self.assertEqual(ct.TPUSpec(t, 8),
+                       utils.gke_tpu_to_tpuspec('{}-8'.format(t.name.lower())))
+
+    for g in ct.GPU:
+      self.assertEqual(
+          g, utils.gke_gpu_to_gpu('nvidia-tesla-{}'.format(g.name.lower())))
+
+    for x in ['', 'v4-8', 'v3-', 'foo', 'nvidia-tesla-']:
+      self.assertIsNone(utils.gke_tpu_to_tpuspec(x))
+      self.assertIsNone(utils.gke_gpu_to_gpu(x))
+
+    # matches pattern but is not a known gpu
+    self.assertIsNone(utils.gke_gpu_to_gpu('nvidia-tesla-z9'))
+
+    return
+
+  # --------------------------------------------------------------------------
+  def test_from_response_helpers(self):
+    """tests response parsing helpers"""
+
+    # missing responses
+    self.assertIsNone(utils._tpu_drivers_from_response(None))
+    self.assertIsNone(utils._zone_tpu_types_from_response(None))
+    self.assertIsNone(utils._zone_gpu_types_from_response(None))
+    self.assertIsNone(utils._region_quotas_from_response(None))
+
+    # invalid responses
+    self.assertIsNone(utils._tpu_drivers_from_response({'foo': 'bar'}))
+    self.assertIsNone(utils._zone_tpu_types_from_response({'foo': 'bar'}))
+    self.assertIsNone(utils._zone_gpu_types_from_response({'foo': 'bar'}))
+    self.assertEqual([], utils._region_quotas_from_response({'foo': 'bar'}))
+
+    # normal responses
+    self.assertEqual(['1.14', '1.15'],
+                     utils._tpu_drivers_from_response({
+                         'tensorflowVersions': [{
+                             'version': '1.14'
+                         }, {
+                             'version': '1.15'
+                         }]
+                     }))
+
+    self.assertEqual([ct.TPUSpec(ct.TPU.V3, 8)],
+                     utils._zone_tpu_types_from_response({
+                         'acceleratorTypes': [{
+                             'type': 'v3-8'
+                         }, {
+                             'type': 'foo-8'
+                         }]
+                     }))
+
+    self.assertEqual([ct.GPUSpec(ct.GPU.K80, 8)],
+                     utils._zone_gpu_types_from_response({
+                         'items': [{
+                             'name': 'nvidia-tesla-k80',
+                             'maximumCardsPerInstance': 8
+                         }, {
+                             'name': 'foo',
+                             'maximumCardsPerInstance': 4
+                         }, {
+                             'name': 'bar'
+                         }]
+                     }))
+
+    return
+
+  # --------------------------------------------------------------------------
+  def test_get_gke_inventory(self):
+    """tests batched inventory retrieval"""
+
+    utils.clear_listing_cache()
+
+    responses = {
+        'tensorflowVersions': {
+            'tensorflowVersions': [{
+                'version': '1.14'
+            }]
+        },
+        'tpuAcceleratorTypes': {
+            'acceleratorTypes': [{
+                'type': 'v2-8'
+            }, {
+                'type': 'v3-32'
+            }]
+        },
+        'gpuAcceleratorTypes': {
+            'items': [{
+                'name': 'nvidia-tesla-p100',
+                'maximumCardsPerInstance': 4
+            }]
+        },
+        'regions': {
+            'quotas': [{
+                'limit': 4,
+                'metric': 'CPUS',
+                'usage': 1
+            }, {
+                'limit': 1024,
+                'metric': 'NVIDIA_K80_GPUS',
+                'usage': 0
+            }]
+        },
+    }
+
+    failed = set()
+    executed = []
+
+    class mock_batch:
+
+      def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+      def add(self, request, request_id):
+        self.requests.append((request, request_id))
+
+      def execute(self):
+        executed.append([r for r, _ in self.requests])
+        for request, request_id in self.requests:
+          if request in failed:
+            self.callback(request_id, None, Exception('exception'))
+          else:
+            self.callback(request_id, responses[request], None)
+
+    class mock_tpu_api:
+
+      def __init__(self):
+        self._resource = None
+
+      def projects(self):
+        return self
+
+      def locations(self):
+        return self
+
+      def tensorflowVersions(self):
+        self._resource = 'tensorflowVersions'
+        return self
+
+      def acceleratorTypes(self):
+        self._resource = 'tpuAcceleratorTypes'
+        return self
+
+      def list(self, parent, fields=None):
+        return self._resource
+
+      def new_batch_http_request(self, callback):
+        return mock_batch(callback)
+
+    class mock_regions:
+
+      def get(self, project, region, fields=None):
+        return 'regions'
+
+    class mock_compute_api:
+
+      def acceleratorTypes(self):
+        return self
+
+      def list(self, project, zone, fields=None):
+        return 'gpuAcceleratorTypes'
+
+      def regions(self):
+        return mock_regions()
+
+      def new_batch_http_request(self, callback):
+        return mock_batch(callback)
+
+    tpu_api = mock_tpu_api()
+    compute_api = mock_compute_api()
+
+    # all requests succeed
+    inventory = utils.get_gke_inventory('p', 'z', 'r', tpu_api, compute_api)
+
+    # one batch per api, two requests per batch
+    self.assertEqual(2, len(executed))
+    self.assertEqual(['tensorflowVersions', 'tpuAcceleratorTypes'], executed[0])
+    self.assertEqual(['gpuAcceleratorTypes', 'regions'], executed[1])
+
+    self.assertEqual(['1.14'], inventory['tpu_drivers'])
+    self.assertEqual(
+        [ct.TPUSpec(ct.TPU.V2, 8),
+         ct.TPUSpec(ct.TPU.V3, 32)], inventory['tpu_types'])
+    self.assertEqual([ct.GPUSpec(ct.GPU.P100, 4)], inventory['gpu_types'])
+    self.assertEqual(
+        utils.resource_limits_from_quotas(responses['regions']['quotas']),
+        inventory['resource_limits'])
+    self.assertEqual([{
+        'resourceType': 'cpu',
+        'maximum': '4'
+    }, {
+        'resourceType': 'memory',
+        'maximum': str(4 * k.MAX_GB_PER_CPU)
+    }, {
+        'resourceType': 'nvidia-tesla-k80',
+        'maximum': '1024'
+    }], inventory['resource_limits'])
+
+    # each failing request only clears its own entry
+    keys = {
+        'tensorflowVersions': 'tpu_drivers',
+        'tpuAcceleratorTypes': 'tpu_types',
+        'gpuAcceleratorTypes': 'gpu_types',
+        'regions': 'resource_limits',
+    }
+
+    for request, key in keys.items():
+      utils.clear_listing_cache()
+      failed.clear()
+      failed.add(request)
+      partial = utils.get_gke_inventory('p', 'z', 'r', tpu_api, compute_api)
+      self.assertIsNone(partial[key])
+      for other in keys.values():
+        if other != key:
+          self.assertEqual(inventory[other], partial[other])
+
+    # cached listings are not requested again, and are shared with the
+    # single-listing functions
+    utils.clear_listing_cache()
+    failed.clear()
+    utils.get_gke_inventory('p', 'z', 'r', tpu_api, compute_api)
+    del executed[:]
+
+    self.assertEqual(inventory,
+                     utils.get_gke_inventory('p', 'z', 'r', tpu_api,
+                                             compute_api))
+    self.assertEqual([['tensorflowVersions']], executed)
+
+    self.assertEqual(inventory['tpu_types'],
+                     utils.get_zone_tpu_types(None, 'p', 'z'))
+    self.assertEqual(inventory['gpu_types'],
+                     utils.get_zone_gpu_types(None, 'p', 'z'))
+    self.assertEqual(responses['regions']['quotas'],
+                     utils.get_region_quotas(None, 'p', 'r'))
+
+    # listings cached by the single-listing functions are used here
+    utils.clear_listing_cache()
+    utils._LISTING_CACHE[('gpu_types', 'p', 'z')] = []
+    del executed[:]
+
+    partial = utils.get_gke_inventory('p', 'z', 'r', tpu_api, compute_api)
+    self.assertEqual([], partial['gpu_types'])
+    self.assertEqual(['regions'], executed[1])
+
+    return
+
+  # --------------------------------------------------------------------------
+  def test_get_zones_inventory(self):
+    """tests parallel zone inventory retrieval"""
+
+    utils.clear_listing_cache()
+
+    class mock_compute_api:
+
+      def acceleratorTypes(self):
+        return self
+
+      def list(self, project, zone, fields=None):
+        return mock_request(
+            {'items': [{
+                'name': 'nvidia-tesla-k80',
+                'maximumCardsPerInstance': len(zone)
+            }]})
+
+    class mock_tpu_api:
+
+      def projects(self):
+        return self
+
+      def locations(self):
+        return self
+
+      def acceleratorTypes(self):
+        return self
+
+      def list(self, parent, fields=None):
+        if parent.endswith('bad'):
+          return mock_request(None)
+        return mock_request({'acceleratorTypes': [{'type': 'v3-8'}]})
+
+    class mock_request:
+
+      def __init__(self, rsp):
+        self.rsp = rsp
+
+      def execute(self):
+        return self.rsp
+
+    apis = {'compute': mock_compute_api, 'tpu': mock_tpu_api}
+
+    with mock.patch.object(utils,
+                           'build_api',
+                           side_effect=lambda n, v, c: apis[n]()):
+      self.assertEqual({}, utils.get_zones_inventory('p', [], None))
+
+      zones = ['z-a', 'zz-b', 'zzz-bad']
+      inventory = utils.get_zones_inventory('p', zones, None)
+
+    self.assertEqual(zones, list(inventory.keys()))
+    for z in zones:
+      self.assertEqual([ct.GPUSpec(ct.GPU.K80, len(z))],
+                       inventory[z]['gpu_types'])
+
+    self.assertEqual([ct.TPUSpec(ct.TPU.V3, 8)], inventory['z-a']['tpu_types'])
+    self.assertIsNone(inventory['zzz-bad']['tpu_types'])
+
+    # build failure
+    with mock.patch.object(utils, 'build_api', side_effect=Exception('e')):
+      self.assertIsNone(utils.get_zones_inventory('p', zones, None))
+
+    return
+
   # --------------------------------------------------------------------------
   @given(st.lists(st.from_regex('[a-zA-Z0-9]+')),
          st.from_regex('_[a-zA-Z0-9]+'))
@@ -594,7 +1035,7 @@ class UtilsTestSuite(unittest.TestCase):
       def regions(self):
         return self
 
-      def get(self, project, region):
+      def get(self, project, region, fields=None):
         return self
 
     def _raises():